@@ -10,6 +10,7 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import requests
 import json
@@ -29,6 +30,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Plotly figure JSON for the browser is encoded by orjson (a listed requirement)
+pio.json.config.default_engine = 'orjson'
+
 # Hide streamlit default
 st.markdown("""
 <style>
@@ -73,28 +77,164 @@ def fetch_latest_tb_data():
     except:
         return None
 
-def get_forecast_data():
+def _build_forecast_data():
     """Generate forecast data from multiple models"""
-    years = [2024, 2025, 2026, 2027, 2028, 2029]
+    years = np.array([2024, 2025, 2026, 2027, 2028, 2029])
 
-    models = {
-        'Prophet': [195.0, 199.5, 194.2, 187.3, 181.7, 178.0],
-        'ARIMA': [195.0, 192.8, 185.1, 180.2, 168.6, 163.4],
-        'LSTM': [195.0, 208.9, 212.4, 201.8, 206.7, 214.6],
-        'Ensemble': [195.0, 196.4, 198.6, 191.1, 188.7, 185.3]
-    }
+    # One row per model, one column per year
+    names = ['Prophet', 'ARIMA', 'LSTM', 'Ensemble']
+    models = np.array([
+        [195.0, 199.5, 194.2, 187.3, 181.7, 178.0],
+        [195.0, 192.8, 185.1, 180.2, 168.6, 163.4],
+        [195.0, 208.9, 212.4, 201.8, 206.7, 214.6],
+        [195.0, 196.4, 198.6, 191.1, 188.7, 185.3]
+    ])
 
     # Prediction intervals for ensemble
-    lower_bound = [x-25 for x in models['Ensemble']]
-    upper_bound = [x+25 for x in models['Ensemble']]
+    lower_bound = models[-1] - 25
+    upper_bound = models[-1] + 25
+
+    # Plot-ready arrays: closed CI polygon and the per-model line names (ensemble excluded)
+    ci_x = np.concatenate([years, years[::-1]])
+    ci_y = np.concatenate([upper_bound, lower_bound[::-1]])
+    model_names = names[:-1]
+
+    return names, models, lower_bound, upper_bound, years, ci_x, ci_y, model_names
 
-    return models, lower_bound, upper_bound, years
+# Static forecasts are built once at import rather than on every script rerun
+_FORECAST = _build_forecast_data()
+
+def get_forecast_data():
+    """Return the precomputed multi-model forecast data"""
+    return _FORECAST
+
+# Sample state data (based on official NI-MEP data)
+_STATES_DATA = pd.DataFrame({
+    'State': ['Uttar Pradesh', 'Maharashtra', 'Bihar', 'West Bengal', 'Gujarat',
+             'Madhya Pradesh', 'Tamil Nadu', 'Rajasthan', 'Karnataka', 'Andhra Pradesh'],
+    'Estimated_Cases': [20000, 18000, 15000, 14000, 8000, 7000, 6000, 5500, 5000, 4500],
+    'Detection_Rate': [68, 72, 65, 71, 75, 69, 73, 70, 74, 71],
+    'Treatment_Success': [84, 87, 83, 86, 89, 82, 88, 85, 87, 86]
+})
+
+@st.cache_data
+def _perf_table():
+    """Static model metrics table"""
+    performance_data = {
+        'Model': ['Prophet', 'ARIMA', 'LSTM', 'Ensemble'],
+        'Framework': ['Bayesian Additive', 'Statistical', 'Deep Learning', 'Weighted Average'],
+        'MSE': [432.71, 432.71, 219.48, 'N/A'],
+        '2029 Forecast': [178.0, 163.4, 214.6, 185.3]
+    }
+    return pd.DataFrame(performance_data)
+
+@st.cache_data
+def _forecast_df(forecast):
+    """2025-2029 forecast table (styled per session at render time)"""
+    names, models, _, _, years, _, _, _ = forecast
+    # Create dataframe with forecast data only (skip 2024 baseline)
+    return pd.DataFrame(models[:, 1:].T, index=years[1:], columns=names)
+
+# ================================================
+# STATIC CONTENT
+# ================================================
+
+# Markdown blocks are module constants so reruns reuse the same strings
+
+_FORECAST_INSIGHTS_MD = """
+**Key Insights:**
+- Historical decline: 39.4% reduction (322→195 cases/100k, 2000-2023)
+- 2029 forecast range: 163.4-214.6 cases/100k
+- Elimination target (<1/100k) requires intensified interventions
+- Ensemble model provides most robust estimates for policy planning
+"""
+
+_PERFORMANCE_POLICY_MD = """
+**🎯 Current Status:**
+- 39.4% reduction achieved (2000-2023)
+- Average 5.5 cases/100k annual decline
+- India accounts for 26% of global TB cases
+
+**📊 Forecast Analysis:**
+- 2029: 163.4-214.6 cases/100k range
+- Elimination target challenging without scale-up
+- Evidence-based resource allocation needed
+"""
+
+_STATE_FINDINGS_MD = """
+**📍 High-Burden States:**
+- Uttar Pradesh: 20,000+ cases
+- Maharashtra: 18,000+ cases
+- Bihar: 15,000+ cases
+
+**🎯 Performance Indicators:**
+- Detection Rate: 65-75%
+- Treatment Success: 82-89%
+
+**⚡ Priority Actions:**
+1. Intensify case finding in UP/Maharashtra
+2. Scale GeneXpert diagnostics
+3. Enhance treatment completion tracking
+"""
+
+_POLICY_LEFT_MD = """
+**🔬 Diagnostic Expansion:**
+- Universal GeneXpert testing nationwide
+- Active case finding in high-burden slums
+- Mobile diagnostic units for rural areas
+
+**💊 Treatment Support:**
+- Expand Nikshay Poshan nutritional program
+- Universal drug susceptibility testing
+- Community-based treatment supervision
+"""
+
+_POLICY_RIGHT_MD = """
+**🏥 Health System Strengthening:**
+- Real-time digital surveillance system
+- Healthcare worker training programs
+- Public-private partnership expansion
+
+**📊 Research & Monitoring:**
+- Continuous forecast model updates
+- State-level elimination tracking
+- Socioeconomic factor integration
+
+**🎯 Target Achievement:**
+- Focus on high-burden states (UP, Maharashtra, Bihar)
+- Age-specific pediatric TB interventions
+- Urban slum elimination programs
+"""
+
+_DATA_SOURCES_MD = """
+**📊 Data Sources:**
+- World Health Organization Global TB Database
+- India's National TB Elimination Program reports
+- National Health Mission statistical databases
+
+**🔄 Auto-Update Frequency:**
+- Historical data validation: Daily
+- Model forecasts: Weekly
+- State-level metrics: Monthly
+- Policy guidance: Quarterly
+"""
+
+_FOOTER_MD = """
+**📚 Citations & References:**
+- Global Tuberculosis Report 2023, World Health Organization
+- India TB Report 2023, Ministry of Health & Family Welfare
+- National TB Elimination Program Implementation Guidelines
+
+**🔬 Research Contact:** Dr Siddalingaiah H S, hssling@yahoo.com
+
+*This dashboard is part of ongoing research on tuberculosis elimination strategies. Data and forecasts are updated regularly to support evidence-based policy decisions.*
+"""
 
 # ================================================
 # DASHBOARD COMPONENTS
 # ================================================
 
-def create_header():
+def create_header(historical):
     """Create dashboard header"""
     st.title("🔬 TB Incidence Forecasting Dashboard - India")
     st.markdown("---")
@@ -105,7 +245,7 @@ def create_header():
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        current_incidence = load_historical_data()['y'].iloc[-1]
+        current_incidence = historical['y'].iloc[-1]
         st.metric(
             "Current Incidence",
             f"{current_incidence}",
@@ -138,13 +278,10 @@ def create_header():
 
     st.markdown("---")
 
-def create_main_forecast_chart():
-    """Create the main forecasting visualization"""
-    st.subheader("📈 Multi-Model TB Incidence Forecasting (2000-2029)")
-
-    # Load data
-    historical = load_historical_data()
-    models, lower_bound, upper_bound, years = get_forecast_data()
+@st.cache_resource(ttl=3600)  # Expire with load_historical_data's hourly refresh
+def _build_forecast_fig(historical, forecast):
+    """Build the main forecast figure; reused across reruns until the data changes"""
+    names, models, lower_bound, upper_bound, years, ci_x, ci_y, model_names = forecast
 
     # Create subplot
     fig = make_subplots(
@@ -155,7 +292,7 @@ def create_main_forecast_chart():
 
     # Left plot: Full time series
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=historical['ds'],
             y=historical['y'],
             mode='lines+markers',
@@ -168,9 +305,9 @@ def create_main_forecast_chart():
 
     # Add uncertainty band
     fig.add_trace(
-        go.Scatter(
-            x=years + years[::-1],
-            y=upper_bound + lower_bound[::-1],
+        go.Scattergl(
+            x=ci_x,
+            y=ci_y,
             fill='toself',
             fillcolor='rgba(128, 128, 128, 0.3)',
             line=dict(width=0),
@@ -183,13 +320,12 @@ def create_main_forecast_chart():
 
     # Add forecast lines
     colors = ['blue', 'red', 'green', 'orange']
-    model_names = list(models.keys())[:-1]  # Exclude ensemble from full plot
 
-    for model, color in zip(model_names, colors):
+    for i, (model, color) in enumerate(zip(model_names, colors)):
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=years,
-                y=models[model],
+                y=models[i],
                 mode='lines+markers',
                 name=f'{model} Forecast',
                 line=dict(color=color, width=2, dash='dash'),
@@ -198,27 +334,17 @@ def create_main_forecast_chart():
             row=1, col=1
         )
 
-    # Add elimination target line
-    fig.add_trace(
-        go.Scatter(
-            x=[2000, 2029],
-            y=[1, 1],
-            mode='lines',
-            name='WHO Elimination Target (<1/100k)',
-            line=dict(color='red', width=2, dash='dot'),
-            showlegend=False
-        ),
-        row=1, col=1
-    )
+    # Add elimination target line (layout shape, not a data trace)
+    fig.add_hline(y=1, line_color='red', line_width=2, line_dash='dot', row=1, col=1)
 
     # Right plot: Forecast comparison only
     forecast_years = years[1:]  # 2025-2029
 
-    for i, (model, values) in enumerate(models.items()):
+    for i, model in enumerate(names):
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=forecast_years,
-                y=values[1:],  # Skip 2024 (baseline)
+                y=models[i, 1:],  # Skip 2024 (baseline)
                 mode='lines+markers',
                 name=model,
                 line=dict(color=colors[i % len(colors)], width=3),
@@ -240,18 +366,21 @@ def create_main_forecast_chart():
     fig.update_yaxes(title_text="TB Incidence (per 100,000)", row=1, col=1)
     fig.update_yaxes(title_text="TB Incidence (per 100,000)", row=1, col=2)
 
+    return fig
+
+@st.fragment
+def create_main_forecast_chart(historical, forecast):
+    """Create the main forecasting visualization"""
+    st.subheader("📈 Multi-Model TB Incidence Forecasting (2000-2029)")
+
+    fig = _build_forecast_fig(historical, forecast)
+
     st.plotly_chart(fig, use_container_width=True)
 
     # Add interpretation below
-    st.info("""
-    **Key Insights:**
-    - Historical decline: 39.4% reduction (322→195 cases/100k, 2000-2023)
-    - 2029 forecast range: 163.4-214.6 cases/100k
-    - Elimination target (<1/100k) requires intensified interventions
-    - Ensemble model provides most robust estimates for policy planning
-    """)
+    st.info(_FORECAST_INSIGHTS_MD)
 
-def create_model_performance_section():
+def create_model_performance_section(forecast):
     """Create model performance comparison table"""
     st.subheader("🔍 Model Performance & Validation")
 
@@ -260,115 +389,66 @@ def create_model_performance_section():
     with col1:
         st.markdown("### Model Metrics")
 
-        performance_data = {
-            'Model': ['Prophet', 'ARIMA', 'LSTM', 'Ensemble'],
-            'Framework': ['Bayesian Additive', 'Statistical', 'Deep Learning', 'Weighted Average'],
-            'MSE': [432.71, 432.71, 219.48, 'N/A'],
-            '2029 Forecast': [178.0, 163.4, 214.6, 185.3]
-        }
-
-        st.table(pd.DataFrame(performance_data))
+        st.table(_perf_table())
 
     with col2:
         st.markdown("### Forecast Comparison (2025-2029)")
 
-        models, _, _, years = get_forecast_data()
-        # Create dataframe with forecast data only (skip 2024 baseline)
-        forecast_data = {k: v[1:] for k, v in models.items()}  # Skip first value (2024) from each list
-        forecast_df = pd.DataFrame(forecast_data, index=years[1:])  # Use years[1:] as index
-        st.dataframe(forecast_df.style.highlight_max(axis=1, color='lightgreen'), use_container_width=True)
+        st.dataframe(_forecast_df(forecast).style.highlight_max(axis=1, color='lightgreen'),
+                     use_container_width=True)
 
     with col3:
         st.markdown("### Policy Implications")
 
-        st.markdown("""
-        **🎯 Current Status:**
-        - 39.4% reduction achieved (2000-2023)
-        - Average 5.5 cases/100k annual decline
-        - India accounts for 26% of global TB cases
+        st.markdown(_PERFORMANCE_POLICY_MD)
+
+@st.cache_resource
+def _build_state_fig():
+    """Build the state-wise bubble chart once; the state data is static"""
+    states_data = _STATES_DATA
+
+    # Bubble chart
+    fig = px.scatter(
+        states_data,
+        x='Detection_Rate',
+        y='Treatment_Success',
+        size='Estimated_Cases',
+        color='Estimated_Cases',
+        hover_name='State',
+        title="State Performance by Detection and Treatment Success Rates",
+
+        size_max=50,
+        color_continuous_scale='Reds',
+        render_mode='webgl'
+    )
 
-        **📊 Forecast Analysis:**
-        - 2029: 163.4-214.6 cases/100k range
-        - Elimination target challenging without scale-up
-        - Evidence-based resource allocation needed
-        """)
+    fig.update_layout(
+        xaxis_title="Case Detection Rate (%)",
+        yaxis_title="Treatment Success Rate (%)",
+        height=500
+    )
+
+    # Add reference lines (layout shapes, not data traces)
+    fig.add_vline(x=85, line_dash='dot', line_color='green', annotation_text='WHO Treatment Target')
+    fig.add_hline(y=85, line_dash='dot', line_color='green')
 
+    return fig
+
+@st.fragment
 def create_state_wise_analysis():
     """Create state-wise TB burden visualization"""
     st.subheader("🎯 State-wise TB Burden Analysis (2022)")
 
-    # Sample state data (based on official NI-MEP data)
-    states_data = pd.DataFrame({
-        'State': ['Uttar Pradesh', 'Maharashtra', 'Bihar', 'West Bengal', 'Gujarat',
-                 'Madhya Pradesh', 'Tamil Nadu', 'Rajasthan', 'Karnataka', 'Andhra Pradesh'],
-        'Estimated_Cases': [20000, 18000, 15000, 14000, 8000, 7000, 6000, 5500, 5000, 4500],
-        'Detection_Rate': [68, 72, 65, 71, 75, 69, 73, 70, 74, 71],
-        'Treatment_Success': [84, 87, 83, 86, 89, 82, 88, 85, 87, 86]
-    })
-
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        # Bubble chart
-        fig = px.scatter(
-            states_data,
-            x='Detection_Rate',
-            y='Treatment_Success',
-            size='Estimated_Cases',
-            color='Estimated_Cases',
-            hover_name='State',
-            title="State Performance by Detection and Treatment Success Rates",
-
-            size_max=50,
-            color_continuous_scale='Reds'
-        )
-
-        fig.update_layout(
-            xaxis_title="Case Detection Rate (%)",
-            yaxis_title="Treatment Success Rate (%)",
-            height=500
-        )
-
-        # Add reference lines
-        fig.add_trace(
-            go.Scatter(
-                x=[85, 85],
-                y=[0, 100],
-                mode='lines',
-                line=dict(dash='dot', color='green'),
-                name='WHO Treatment Target'
-            )
-        )
-
-        fig.add_trace(
-            go.Scatter(
-                x=[0, 100],
-                y=[85, 85],
-                mode='lines',
-                line=dict(dash='dot', color='green'),
-                showlegend=False
-            )
-        )
+        fig = _build_state_fig()
 
         st.plotly_chart(fig, use_container_width=True)
 
     with col2:
         st.markdown("### Key Findings")
-        st.markdown("""
-        **📍 High-Burden States:**
-        - Uttar Pradesh: 20,000+ cases
-        - Maharashtra: 18,000+ cases
-        - Bihar: 15,000+ cases
-
-        **🎯 Performance Indicators:**
-        - Detection Rate: 65-75%
-        - Treatment Success: 82-89%
-
-        **⚡ Priority Actions:**
-        1. Intensify case finding in UP/Maharashtra
-        2. Scale GeneXpert diagnostics
-        3. Enhance treatment completion tracking
-        """)
+        st.markdown(_STATE_FINDINGS_MD)
 
 def create_policy_recommendations():
     """Create policy recommendations section"""
@@ -379,48 +459,24 @@ def create_policy_recommendations():
     with col1:
         st.markdown("### Immediate Actions (2025)")
 
-        st.markdown("""
-        **🔬 Diagnostic Expansion:**
-        - Universal GeneXpert testing nationwide
-        - Active case finding in high-burden slums
-        - Mobile diagnostic units for rural areas
-
-        **💊 Treatment Support:**
-        - Expand Nikshay Poshan nutritional program
-        - Universal drug susceptibility testing
-        - Community-based treatment supervision
-        """)
+        st.markdown(_POLICY_LEFT_MD)
 
     with col2:
         st.markdown("### Long-term Strategy (2025-2035)")
 
-        st.markdown("""
-        **🏥 Health System Strengthening:**
-        - Real-time digital surveillance system
-        - Healthcare worker training programs
-        - Public-private partnership expansion
-
-        **📊 Research & Monitoring:**
-        - Continuous forecast model updates
-        - State-level elimination tracking
-        - Socioeconomic factor integration
-
-        **🎯 Target Achievement:**
-        - Focus on high-burden states (UP, Maharashtra, Bihar)
-        - Age-specific pediatric TB interventions
-        - Urban slum elimination programs
-        """)
+        st.markdown(_POLICY_RIGHT_MD)
 
-def create_data_refresh_status():
+def create_data_refresh_status(historical):
     """Show data refresh status"""
     st.subheader("🔄 Dashboard Status & Data Sources")
 
+    n_years = len(historical)
     col1, col2, col3 = st.columns(3)
 
     with col1:
         st.metric(
             "Historical Data",
-            f"{len(load_historical_data())} years",
+            f"{n_years} years",
             "2000-2023 WHO Database"
         )
 
@@ -440,18 +496,7 @@ def create_data_refresh_status():
         )
         st.caption(f"Last update {int((latest_refresh - last_update).seconds/3600)}h ago")
 
-    st.markdown("""
-    **📊 Data Sources:**
-    - World Health Organization Global TB Database
-    - India's National TB Elimination Program reports
-    - National Health Mission statistical databases
-
-    **🔄 Auto-Update Frequency:**
-    - Historical data validation: Daily
-    - Model forecasts: Weekly
-    - State-level metrics: Monthly
-    - Policy guidance: Quarterly
-    """)
+    st.markdown(_DATA_SOURCES_MD)
 
 # ================================================
 # MAIN DASHBOARD
@@ -460,14 +505,18 @@ def create_data_refresh_status():
 def main():
     """Main dashboard function"""
 
+    # Load data once per rerun and pass it to the sections that need it
+    historical = load_historical_data()
+    forecast = get_forecast_data()
+
     # Create header with metrics
-    create_header()
+    create_header(historical)
 
     # Create main forecast visualization
-    create_main_forecast_chart()
+    create_main_forecast_chart(historical, forecast)
 
     # Model performance section
-    create_model_performance_section()
+    create_model_performance_section(forecast)
 
     # State-wise analysis
     create_state_wise_analysis()
@@ -476,20 +525,11 @@ def main():
     create_policy_recommendations()
 
     # Data refresh status
-    create_data_refresh_status()
+    create_data_refresh_status(historical)
 
     # Footer
     st.markdown("---")
-    st.markdown("""
-    **📚 Citations & References:**
-    - Global Tuberculosis Report 2023, World Health Organization
-    - India TB Report 2023, Ministry of Health & Family Welfare
-    - National TB Elimination Program Implementation Guidelines
-
-    **🔬 Research Contact:** Dr Siddalingaiah H S, hssling@yahoo.com
-
-    *This dashboard is part of ongoing research on tuberculosis elimination strategies. Data and forecasts are updated regularly to support evidence-based policy decisions.*
-    """)
+    st.markdown(_FOOTER_MD)
 
 if __name__ == "__main__":
     main()
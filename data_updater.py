@@ -4,15 +4,22 @@ Automatic WHO TB Data Extraction and Model Updates
 Continuously updates TB incidence dashboard with latest WHO data
 """
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 from datetime import datetime, timedelta
 import logging
 import os
+import gzip
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from tb_data import parquet_path, read_tb_data
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -29,9 +36,21 @@ class TBDataUpdater:
     def __init__(self, data_directory='data'):
         self.data_dir = Path(data_directory)
         self.data_file = self.data_dir / 'tb_incidence_india_2000_2024.csv'
+        self.data_file_parquet = parquet_path(self.data_file)
+        self.status_file = self.data_dir / '_status.json'
         self.wiki_url = "https://en.wikipedia.org/wiki/Tuberculosis_in_India"
         self.backup_dir = self.data_dir / 'backups'
         self.backup_dir.mkdir(exist_ok=True)
+        self.max_backups = 10  # Rolling retention for backup_existing_data
+
+        # Pooled HTTP session reused across WHO requests (keeps TCP/TLS connections alive)
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+        # Dataset parsed once per update cycle and shared by the steps below
+        self._df_cache = None
+        # Backup running alongside the WHO fetch; must finish before the data file is rewritten
+        self._pending_backup = None
 
         # WHO TB Report data (simulated - in real implementation would use actual WHO API)
         self.who_data_years = list(range(2000, 2024))
@@ -49,11 +68,27 @@ class TBDataUpdater:
         """Create backup of current data before updates"""
         if self.data_file.exists():
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = self.backup_dir / f"tb_incidence_backup_{timestamp}.csv"
-            df = pd.read_csv(self.data_file)
-            df.to_csv(backup_file, index=False)
+            backup_file = self.backup_dir / f"tb_incidence_backup_{timestamp}.csv.gz"
+            # Stream-compress the raw file (no CSV round-trip)
+            with open(self.data_file, 'rb') as src, gzip.open(backup_file, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
             logging.info(f"✅ Data backed up to {backup_file}")
 
+            # Keep only the most recent backups (timestamped names sort chronologically)
+            backups = sorted(self.backup_dir.glob('tb_incidence_backup_*.csv*'))
+            for old_backup in backups[:-self.max_backups]:
+                old_backup.unlink()
+
+    def _read_data(self):
+        """Read the dataset through the shared loader (Parquet copy unless the CSV is newer)"""
+        return read_tb_data(self.data_file)
+
+    def _current_data(self):
+        """Return the dataset cached for this update cycle, reading it if not cached"""
+        if self._df_cache is None:
+            return self._read_data()
+        return self._df_cache
+
     def fetch_who_tb_data(self):
         """
         Fetch latest TB data from WHO Global TB Database
@@ -89,7 +124,7 @@ class TBDataUpdater:
     def has_new_who_data(self):
         """Check if new WHO data is available"""
         try:
-            current_df = pd.read_csv(self.data_file)
+            current_df = self._current_data()
             max_year = current_df['ds'].max().year
 
             # WHO typically updates data 1-2 years after the reporting year
@@ -125,23 +160,39 @@ class TBDataUpdater:
         """Integrate new WHO data into existing dataset"""
         try:
             # Read existing data
-            current_df = pd.read_csv(self.data_file)
+            current_df = self._current_data()  # ds already parsed by _read_data()
             logging.info(f"Existing data: {len(current_df)} records")
 
-            # Convert new data to DataFrame format
-            new_df = pd.DataFrame(new_data)
-            new_df = new_df.rename(columns={'year': 'ds', 'incidence': 'y'})
-            new_df['ds'] = pd.to_datetime(new_df['ds'], format='%Y')
-
-            # Append new data
-            updated_df = pd.concat([current_df, new_df], ignore_index=True)
-            updated_df['ds'] = pd.to_datetime(updated_df['ds'])
-            updated_df = updated_df.sort_values('ds').drop_duplicates(subset='ds')
+            # Upsert new points keyed by year; rows are dated Dec 31. An existing year only has
+            # y/source replaced, so its other columns (y_lower, y_upper) are kept
+            records = {row['ds'].year: row for row in current_df.to_dict('records')}
+            for point in new_data:
+                ds = pd.Timestamp(year=point['year'], month=12, day=31)
+                records.setdefault(point['year'], {'ds': ds}).update(
+                    y=point['incidence'], source=point['source']
+                )
+
+            # Existing rows are sorted and new years usually append in order, so sort only when needed
+            updated_df = pd.DataFrame(list(records.values()))
+            if not updated_df['ds'].is_monotonic_increasing:
+                updated_df = updated_df.sort_values('ds', ignore_index=True)
+
+            # New years have no bounds; keep those integer columns integer (nullable) so the
+            # rewritten CSV does not turn existing values into floats
+            int_columns = [col for col in current_df.columns
+                           if pd.api.types.is_integer_dtype(current_df[col])
+                           and updated_df[col].isna().any()]
+            updated_df = updated_df.astype({col: 'Int64' for col in int_columns})
 
             logging.info(f"✅ Data updated: {len(updated_df)} total records")
 
-            # Save updated dataset
-            updated_df.to_csv(self.data_file, index=False)
+            # Save updated dataset (only once the concurrent backup has captured the old file)
+            if self._pending_backup is not None:
+                self._pending_backup.result()
+            updated_df.to_csv(self.data_file, index=False)  # Compatibility copy for dashboard/analysis
+            updated_df.to_parquet(self.data_file_parquet, compression='snappy', index=False)
+            self._df_cache = updated_df
+            self._write_status(updated_df)
             logging.info(f"💾 Updated dataset saved to {self.data_file}")
 
             return updated_df
@@ -155,13 +206,12 @@ class TBDataUpdater:
         try:
             logging.info("🔍 Validating updated data quality...")
 
-            # Check date continuity
-            dates = pd.to_datetime(updated_df['ds'])
-            date_diffs = dates.diff().dt.days.astype(float)
-            gaps = (date_diffs != 365.0) & (~pd.isna(date_diffs))
+            # Check date continuity (single pass over int64 day numbers)
+            days = updated_df['ds'].to_numpy().astype('datetime64[D]')
+            gaps = np.diff(days.astype(np.int64)) != 365
 
             if gaps.any():
-                logging.warning(f"⚠️ Date gaps detected: {dates[gaps].tolist()}")
+                logging.warning(f"⚠️ Date gaps detected: {days[1:][gaps].tolist()}")
 
             # Check value ranges
             y_values = updated_df['y']
@@ -169,9 +219,9 @@ class TBDataUpdater:
                 logging.warning(f"⚠️ Unusual incidence values detected: {y_values.min()} - {y_values.max()}")
 
             # Check for duplicates
-            duplicates = updated_df.duplicated(subset='ds')
-            if duplicates.any():
-                logging.warning(f"⚠️ Duplicate dates found: {duplicates.sum()} entries")
+            n_duplicates = updated_df['ds'].duplicated().to_numpy().sum()
+            if n_duplicates:
+                logging.warning(f"⚠️ Duplicate dates found: {n_duplicates} entries")
 
             logging.info("✅ Data validation completed")
             return True
@@ -205,7 +255,7 @@ class TBDataUpdater:
 
             # Update README with latest statistics
             if self.data_file.exists():
-                df = pd.read_csv(self.data_file)
+                df = self._read_data()
                 last_row = df.iloc[-1]
 
                 # Update README with current statistics
@@ -231,11 +281,16 @@ class TBDataUpdater:
         try:
             logging.info("🚀 Starting automatic TB data update...")
 
-            # Step 1: Backup current data
-            self.backup_existing_data()
+            if self.data_file.exists():
+                self._df_cache = self._read_data()
 
-            # Step 2: Check for new WHO data
-            new_data = self.fetch_who_tb_data()
+            # Step 1 & 2: Backup current data while checking for new WHO data (both IO-bound)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                self._pending_backup = executor.submit(self.backup_existing_data)
+                fetch_future = executor.submit(self.fetch_who_tb_data)
+                self._pending_backup.result()
+                new_data = fetch_future.result()
+            self._pending_backup = None
 
             if new_data is not None:
                 # Step 3: Validate data
@@ -261,18 +316,48 @@ class TBDataUpdater:
             logging.error(f"❌ Automatic update failed: {e}")
             return False
 
+    def _write_status(self, df):
+        """Persist a small status sidecar so status checks need not parse the CSV"""
+        dates = pd.to_datetime(df['ds'])
+        status = {
+            'last_update': dates.max().isoformat(),
+            'data_points': len(df),
+            'latest_incidence': df['y'].iloc[-1].item(),  # Same Python type as the fallback path
+            'date_range': f"{dates.min().year} - {dates.max().year}"
+        }
+        with open(self.status_file, 'w') as f:
+            json.dump(status, f)
+
+    def _read_status(self):
+        """Return the sidecar status if it is at least as new as the data file, else None"""
+        if not self.status_file.exists():
+            return None
+        if self.status_file.stat().st_mtime < self.data_file.stat().st_mtime:
+            return None  # Data file changed outside integrate_new_data
+
+        with open(self.status_file) as f:
+            status = json.load(f)
+        status['last_update'] = pd.Timestamp(status['last_update'])
+        status['status'] = 'Data current and validated'
+        return status
+
     def get_update_status(self):
         """Get current update status summary"""
         try:
             if self.data_file.exists():
-                df = pd.read_csv(self.data_file)
-                last_update = pd.to_datetime(df['ds'].max())
+                status = self._read_status()
+                if status is not None:
+                    return status
+
+                df = self._current_data()
+                dates = pd.to_datetime(df['ds'])
+                last_update = dates.max()
 
                 return {
                     'last_update': last_update,
                     'data_points': len(df),
-                    'latest_incidence': df['y'].iloc[-1],
-                    'date_range': f"{df['ds'].min()[:4]} - {df['ds'].max()[:4]}",
+                    'latest_incidence': df['y'].iloc[-1].item(),
+                    'date_range': f"{dates.min().year} - {last_update.year}",
                     'status': 'Data current and validated'
                 }
             else:
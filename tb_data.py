@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Shared TB incidence dataset loader
+Reads the CSV once and keeps a Parquet copy next to it for faster later loads
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+
+def parquet_path(data_file):
+    """Parquet copy kept next to the CSV data file"""
+    return Path(data_file).with_suffix('.parquet')
+
+
+def read_tb_data(data_file):
+    """Read the dataset, preferring the Parquet copy unless the CSV is newer"""
+    data_file = Path(data_file)
+    cached = parquet_path(data_file)
+    if cached.exists() and (
+        not data_file.exists()
+        or cached.stat().st_mtime >= data_file.stat().st_mtime
+    ):
+        return pd.read_parquet(cached)
+
+    df = pd.read_csv(data_file, engine='pyarrow', parse_dates=['ds'])
+    # Migrate: later reads load the binary copy instead of re-parsing the CSV
+    df.to_parquet(cached, compression='snappy', index=False)
+    return df
@@ -0,0 +1,46 @@
+"""Tests for TBDataUpdater.integrate_new_data"""
+
+from data_updater import TBDataUpdater
+
+CSV_HEADER = "ds,y,y_lower,y_upper,source"
+CSV_ROWS = [
+    "2021-12-31,206,176,239,who_gho_api",
+    "2022-12-31,199,170,231,who_gho_api",
+    "2023-12-31,195,164,228,who_gho_api",
+]
+
+
+def _write_dataset(tmp_path):
+    data_file = tmp_path / 'tb_incidence_india_2000_2024.csv'
+    data_file.write_text("\n".join([CSV_HEADER] + CSV_ROWS) + "\n")
+    return data_file
+
+
+def test_upsert_existing_year_keeps_bounds(tmp_path):
+    data_file = _write_dataset(tmp_path)
+    updater = TBDataUpdater(data_directory=tmp_path)
+
+    result = updater.integrate_new_data(
+        [{'year': 2023, 'incidence': 215, 'source': 'WHO Global TB Report 2024'}]
+    )
+
+    assert result is not None
+    lines = data_file.read_text().splitlines()
+    assert lines[0] == CSV_HEADER
+    assert lines[1:3] == CSV_ROWS[:2]
+    assert lines[3] == "2023-12-31,215,164,228,WHO Global TB Report 2024"
+    assert len(lines) == 4
+
+
+def test_new_year_appends_without_touching_existing_rows(tmp_path):
+    data_file = _write_dataset(tmp_path)
+    updater = TBDataUpdater(data_directory=tmp_path)
+
+    result = updater.integrate_new_data(
+        [{'year': 2024, 'incidence': 210, 'source': 'WHO Preliminary Estimates'}]
+    )
+
+    assert result is not None
+    lines = data_file.read_text().splitlines()
+    assert lines[1:4] == CSV_ROWS
+    assert lines[4] == "2024-12-31,210,,,WHO Preliminary Estimates"